@@ -6,14 +6,41 @@ Author: Nguyen Phuc Nguyen
 Version: 1.0.0
 """
 
-from .ui import DemBonesUI
-from .controller import DemBonesController
-from .validator import DemBonesValidator
-from . import utils
+import importlib
 
 __version__ = "1.0.0"
 __all__ = ['show_ui', 'DemBonesUI', 'DemBonesController', 'DemBonesValidator', 'utils']
 
+# Public names resolved lazily: name -> (submodule, attribute or None for the module)
+_LAZY_ATTRS = {
+    'DemBonesUI': ('.ui', 'DemBonesUI'),
+    'DemBonesController': ('.controller', 'DemBonesController'),
+    'DemBonesValidator': ('.validator', 'DemBonesValidator'),
+    'utils': ('.utils', None),
+}
+
+# importlib.reload keeps the module namespace, so drop values cached by
+# __getattr__ to let them resolve against the reloaded submodules
+for _name in _LAZY_ATTRS:
+    globals().pop(_name, None)
+del _name
+
+
+def __getattr__(name):
+    """
+    Import submodules on first attribute access (PEP 562)
+    
+    Keeps importing the package free of maya.cmds until the tool is used.
+    """
+    if name not in _LAZY_ATTRS:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    
+    module_name, attr = _LAZY_ATTRS[name]
+    module = importlib.import_module(module_name, __name__)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
 
 def show_ui():
     """
@@ -22,6 +49,8 @@ def show_ui():
     Returns:
         DemBonesUI: The UI instance
     """
+    from .ui import DemBonesUI
+    
     ui = DemBonesUI()
     ui.create()
     return ui
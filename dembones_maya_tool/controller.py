@@ -6,12 +6,63 @@ from . import utils
 from . import validator
 
 
+# Keyword arguments for cmds.demBones, copied and filled in per call
+_DEMBONES_KW_TEMPLATE = {
+    'sourceMesh': None,
+    'targetMesh': None,
+    'startFrame': 0,
+    'endFrame': 0,
+    'globalIters': 0,
+    'numBones': 0
+}
+
+
 class DemBonesController:
     """Controller for Dem Bones operations"""
     
     def __init__(self):
         self.source_mesh = ""
         self.target_mesh = ""
+        
+        # utils.get_selected_mesh_handle() result, dropped whenever selection
+        # changes. A handle rather than a path, so renames and reparents of
+        # the selected mesh (which fire no SelectionChanged) are followed.
+        self._cached_selection = None
+        self._sel_job = cmds.scriptJob(
+            event=['SelectionChanged', self._on_selection_changed],
+            protected=True
+        )
+    
+    def dispose(self):
+        """Kill the selection scriptJob (safe to call more than once)"""
+        if self._sel_job is not None and cmds.scriptJob(exists=self._sel_job):
+            cmds.scriptJob(kill=self._sel_job, force=True)
+        self._sel_job = None
+    
+    def _on_selection_changed(self):
+        """Invalidate the cached selection"""
+        self._cached_selection = None
+    
+    def _get_selected_mesh(self):
+        """
+        Get the selected mesh, querying Maya only after a selection change
+        
+        Returns:
+            tuple: (success, full_path, message)
+        """
+        if self._cached_selection is None:
+            self._cached_selection = utils.get_selected_mesh_handle()
+        
+        success, handle, message = self._cached_selection
+        if not success:
+            return (False, None, message)
+        
+        # Resolve the path on every read (O(1)); requery if the node is gone
+        full_path = utils.get_handle_path(handle)
+        if full_path is None:
+            self._cached_selection = None
+            return self._get_selected_mesh()
+        return (True, full_path, message)
     
     def set_source_mesh_from_selection(self):
         """
@@ -20,7 +71,7 @@ class DemBonesController:
         Returns:
             tuple: (success, full_path, short_name, message)
         """
-        success, full_path, message = utils.get_selected_mesh()
+        success, full_path, message = self._get_selected_mesh()
         
         if success:
             self.source_mesh = full_path
@@ -36,7 +87,7 @@ class DemBonesController:
         Returns:
             tuple: (success, full_path, short_name, message)
         """
-        success, full_path, message = utils.get_selected_mesh()
+        success, full_path, message = self._get_selected_mesh()
         
         if success:
             self.target_mesh = full_path
@@ -86,16 +137,21 @@ class DemBonesController:
         if not success:
             return (False, message)
         
-        # Run Dem Bones
+        kw = _DEMBONES_KW_TEMPLATE.copy()
+        kw.update(
+            sourceMesh=self.source_mesh,
+            targetMesh=self.target_mesh,
+            startFrame=int(start_frame),
+            endFrame=int(end_frame),
+            globalIters=int(global_iters),
+            numBones=int(num_bones)
+        )
+        
+        # Run Dem Bones. The plugin samples the source mesh per frame itself
+        # and takes no pre-sampled positions, so there is nothing to cache here.
         try:
-            cmds.demBones(
-                sourceMesh=self.source_mesh,
-                targetMesh=self.target_mesh,
-                startFrame=start_frame,
-                endFrame=end_frame,
-                globalIters=global_iters,
-                numBones=num_bones
-            )
+            with utils.main_progress("Solving Dem Bones..."), utils.tool_state():
+                cmds.demBones(**kw)
             
             target_name = utils.get_short_name(self.target_mesh)
             success_msg = "SUCCESS! {} bones created on '{}'".format(
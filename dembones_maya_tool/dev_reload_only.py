@@ -11,14 +11,28 @@ tool_path = "D:/"
 if tool_path not in sys.path:
     sys.path.insert(0, tool_path)
 
+import maya.cmds as cmds
+
 # Import main module
 import dembones_maya_tool
 
-# Reload all submodules
-importlib.reload(dembones_maya_tool.utils)
-importlib.reload(dembones_maya_tool.validator)
-importlib.reload(dembones_maya_tool.controller)
-importlib.reload(dembones_maya_tool.ui)
+# Close the window first: a reloaded DemBonesUI starts out not knowing it exists
+if cmds.window("demBonesToolWindow", exists=True):
+    cmds.deleteUI("demBonesToolWindow")
+
+# Submodules in dependency order
+RELOAD_ORDER = ['utils', 'validator', 'controller', 'ui']
+
+importlib.invalidate_caches()
+
+# Reload only the submodules that have actually been imported
+loaded = [name for name in list(sys.modules)
+          if name.startswith('dembones_maya_tool.')
+          and name.rpartition('.')[2] in RELOAD_ORDER]
+loaded.sort(key=lambda name: RELOAD_ORDER.index(name.rpartition('.')[2]))
+
+for name in loaded:
+    importlib.reload(sys.modules[name])
 importlib.reload(dembones_maya_tool)
 
 # Show UI
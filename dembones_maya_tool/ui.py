@@ -2,6 +2,18 @@
 User Interface for Dem Bones Maya Tool
 """
 import maya.cmds as cmds # type: ignore
+
+# Qt access is optional: without it the status bar falls back to cmds.text
+try:
+    import maya.OpenMayaUI as omui # type: ignore
+    try:
+        from shiboken6 import wrapInstance # type: ignore
+        from PySide6 import QtWidgets # type: ignore
+    except ImportError:
+        from shiboken2 import wrapInstance # type: ignore
+        from PySide2 import QtWidgets # type: ignore
+except ImportError:
+    omui = None
 from . import controller
 from . import utils
 
@@ -11,15 +23,21 @@ class DemBonesUI:
     
     WINDOW_NAME = "demBonesToolWindow"
     WINDOW_TITLE = "Dem Bones Tool - NguyenNP"
+    PARAM_KEYS = ('start_frame', 'end_frame', 'global_iters', 'num_bones')
+    
+    # Whether WINDOW_NAME is currently open; shared because WINDOW_NAME is the same for every instance
+    _exists = False
     
     def __init__(self):
         self.controller = controller.DemBonesController()
         self.widgets = {}
+        self._param_widgets = []
+        self._status_label = None
     
     def create(self):
         """Create and show the UI window"""
         # Delete existing window
-        if cmds.window(self.WINDOW_NAME, exists=True):
+        if DemBonesUI._exists:
             cmds.deleteUI(self.WINDOW_NAME)
         
         # Create window
@@ -35,6 +53,15 @@ class DemBonesUI:
         
         # Show window
         cmds.showWindow(window)
+        DemBonesUI._exists = True
+        
+        # Track closing and release controller callbacks however it happens
+        cmds.scriptJob(uiDeleted=[self.WINDOW_NAME, self._on_window_deleted], runOnce=True)
+    
+    def _on_window_deleted(self):
+        """Handle the window being deleted"""
+        DemBonesUI._exists = False
+        self.controller.dispose()
     
     def _create_widgets(self):
         """Create all UI widgets"""
@@ -81,6 +108,7 @@ class DemBonesUI:
             font='obliqueLabelFont', 
             height=30
         )
+        self._status_label = self._wrap_status_label()
         
         cmds.separator(height=5, style='none')
         
@@ -88,6 +116,9 @@ class DemBonesUI:
         self._create_buttons()
         
         cmds.separator(height=10, style='none')
+        
+        # Parameter fields in the order _on_generate_button_clicked reads them
+        self._param_widgets = [self.widgets[key] for key in self.PARAM_KEYS]
     
     def _create_mesh_section(self, label, field_key, button_command):
         """Create a mesh selection section"""
@@ -206,18 +237,26 @@ class DemBonesUI:
         """Handle timeline button click"""
         start, end = utils.get_timeline_range()
         
-        cmds.intField(self.widgets['start_frame'], edit=True, value=start)
-        cmds.intField(self.widgets['end_frame'], edit=True, value=end)
+        cmds.refresh(suspend=True)
+        try:
+            cmds.intField(self.widgets['start_frame'], edit=True, value=start)
+            cmds.intField(self.widgets['end_frame'], edit=True, value=end)
+        finally:
+            cmds.refresh(suspend=False)
         
         self._show_success("Frame range set: {} - {}".format(start, end))
     
     def _on_generate_button_clicked(self, *args):
         """Handle generate button click"""
         # Get parameters from UI
-        start_frame = cmds.intField(self.widgets['start_frame'], query=True, value=True)
-        end_frame = cmds.intField(self.widgets['end_frame'], query=True, value=True)
-        global_iters = cmds.intField(self.widgets['global_iters'], query=True, value=True)
-        num_bones = cmds.intField(self.widgets['num_bones'], query=True, value=True)
+        cmds.refresh(suspend=True)
+        try:
+            start_frame, end_frame, global_iters, num_bones = [
+                cmds.intField(widget, query=True, value=True)
+                for widget in self._param_widgets
+            ]
+        finally:
+            cmds.refresh(suspend=False)
         
         # Validate inputs
         is_valid, errors = self.controller.validate_inputs(
@@ -225,8 +264,9 @@ class DemBonesUI:
         )
         
         if not is_valid:
-            error_msg = "Validation Errors:\n\n" + "\n".join("- " + e for e in errors)
-            self._show_error(error_msg)
+            # The modal dialog is the error signal; the status bar would be hidden behind it
+            error_lines = ["- " + e for e in errors]
+            error_msg = "Validation Errors:\n\n" + "\n".join(error_lines)
             cmds.confirmDialog(
                 title='Validation Error',
                 message=error_msg,
@@ -266,35 +306,64 @@ class DemBonesUI:
     
     def _on_close_button_clicked(self, *args):
         """Handle close button click"""
-        if cmds.window(self.WINDOW_NAME, exists=True):
+        self.controller.dispose()
+        if DemBonesUI._exists:
             cmds.deleteUI(self.WINDOW_NAME)
     
     # Status Display Methods
     
-    def _show_error(self, message):
-        """Show error message in status bar"""
+    def _wrap_status_label(self):
+        """
+        Get the QLabel behind the status text control
+        
+        Returns:
+            QtWidgets.QLabel: The label, or None if Qt is unavailable
+        """
+        if omui is None:
+            return None
+        try:
+            ptr = omui.MQtUtil.findControl(self.widgets['status_text'])
+            if not ptr:
+                return None
+            return wrapInstance(int(ptr), QtWidgets.QLabel)
+        except Exception:
+            return None
+    
+    def _set_status(self, label, color):
+        """
+        Update the status bar text and background color
+        
+        Args:
+            label (str): Status text
+            color (list): Background color as [r, g, b] floats in 0-1
+        """
+        if self._status_label is not None:
+            try:
+                self._status_label.setText(label)
+                self._status_label.setStyleSheet(
+                    "background-color: rgb({}, {}, {})".format(
+                        *[int(round(c * 255)) for c in color]))
+                return
+            except RuntimeError:
+                # Underlying Qt widget is gone, use the command layer
+                self._status_label = None
+        
         cmds.text(
             self.widgets['status_text'], 
             edit=True, 
-            label="ERROR: " + message, 
-            backgroundColor=[0.8, 0.3, 0.3]
+            label=label, 
+            backgroundColor=color
         )
+    
+    def _show_error(self, message):
+        """Show error message in status bar"""
+        self._set_status("ERROR: " + message, [0.8, 0.3, 0.3])
         cmds.warning(message)
     
     def _show_success(self, message):
         """Show success message in status bar"""
-        cmds.text(
-            self.widgets['status_text'], 
-            edit=True, 
-            label=message, 
-            backgroundColor=[0.3, 0.7, 0.3]
-        )
+        self._set_status(message, [0.3, 0.7, 0.3])
     
     def _show_info(self, message):
         """Show info message in status bar"""
-        cmds.text(
-            self.widgets['status_text'], 
-            edit=True, 
-            label=message, 
-            backgroundColor=[0.3, 0.5, 0.8]
-        )
\ No newline at end of file
+        self._set_status(message, [0.3, 0.5, 0.8])
@@ -1,7 +1,42 @@
 """
 Utility functions for Dem Bones Maya Tool
 """
+import contextlib
+import sys
+
 import maya.cmds as cmds # type: ignore
+import maya.mel as mel # type: ignore
+import maya.api.OpenMaya as om # type: ignore
+
+__all__ = [
+    'get_short_name',
+    'tool_context',
+    'maintained_selection_api',
+    'tool_state',
+    'main_progress',
+    'get_selected_mesh',
+    'get_selected_mesh_handle',
+    'get_handle_path',
+    'check_topology_match',
+    'get_timeline_range',
+    'load_dembones_plugin',
+    'duplicate_static_meshes',
+]
+
+# Print the topology report from check_topology_match
+_DEBUG = False
+
+# Set once the DemBones plugin is known to be loaded
+_PLUGIN_LOADED = False
+
+# importlib.reload keeps the module namespace, so remove the callback an
+# earlier load registered; it still points at the old _on_plugin_unloaded
+if globals().get('_PLUGIN_CALLBACK_ID') is not None:
+    try:
+        om.MMessage.removeCallback(_PLUGIN_CALLBACK_ID)
+    except RuntimeError:
+        pass
+_PLUGIN_CALLBACK_ID = None
 
 
 def get_short_name(full_path):
@@ -16,7 +51,119 @@ def get_short_name(full_path):
     """
     if not full_path:
         return ""
-    return full_path.split('|')[-1]
+    return full_path.rpartition('|')[2] or full_path
+
+
+@contextlib.contextmanager
+def tool_context(ctx):
+    """
+    Temporarily switch the active tool context
+    
+    Mesh queries can be far slower while a manipulator tool (Move, Rotate,
+    Scale) is active, so hot query paths run under the Select tool.
+    
+    Args:
+        ctx (str): Tool context name, e.g. 'selectSuperContext'
+    """
+    original_ctx = cmds.currentCtx()
+    if original_ctx != ctx:
+        cmds.setToolTo(ctx)
+    try:
+        yield
+    finally:
+        if original_ctx != ctx:
+            cmds.setToolTo(original_ctx)
+
+
+@contextlib.contextmanager
+def maintained_selection_api():
+    """Restore the active selection on exit, using OpenMaya API 2.0"""
+    selection = om.MGlobal.getActiveSelectionList()
+    try:
+        yield
+    finally:
+        # Only restore if needed, so SelectionChanged listeners stay quiet
+        current = om.MGlobal.getActiveSelectionList()
+        if current.getSelectionStrings() != selection.getSelectionStrings():
+            om.MGlobal.setActiveSelectionList(selection)
+
+
+@contextlib.contextmanager
+def tool_state():
+    """
+    Run a heavy operation with viewport refresh and the evaluation
+    manager disabled
+    
+    Everything done inside the block is recorded as one undo chunk, so a
+    single undo reverts it. Evaluation manager mode and current time are
+    restored on exit.
+    """
+    em_mode = cmds.evaluationManager(query=True, mode=True)[0]
+    current_time = cmds.currentTime(query=True)
+    
+    cmds.evaluationManager(mode='off')
+    cmds.refresh(suspend=True)
+    cmds.undoInfo(openChunk=True)
+    try:
+        yield
+    finally:
+        cmds.undoInfo(closeChunk=True)
+        cmds.refresh(suspend=False)
+        cmds.evaluationManager(mode=em_mode)
+        cmds.currentTime(current_time)
+
+
+@contextlib.contextmanager
+def main_progress(status):
+    """
+    Show a busy status on Maya's main progress bar while the block runs
+    
+    In batch mode (mayapy, render farm) there is no progress bar and the
+    block simply runs.
+    
+    Args:
+        status (str): Status text shown next to the progress bar
+    """
+    progress_bar = None
+    if not cmds.about(batch=True):
+        # Declaring the global keeps this from raising if the UI never set it
+        progress_bar = mel.eval('global string $gMainProgressBar; $tmp = $gMainProgressBar')
+    
+    if not progress_bar:
+        yield
+        return
+    
+    cmds.progressBar(
+        progress_bar,
+        edit=True,
+        beginProgress=True,
+        isInterruptable=False,
+        status=status,
+        maxValue=1
+    )
+    try:
+        yield
+    finally:
+        cmds.progressBar(progress_bar, edit=True, endProgress=True)
+
+
+def _find_mesh_shape(dag_path):
+    """
+    Find the first non-intermediate mesh shape directly below a transform
+    
+    Args:
+        dag_path (om.MDagPath): Path to a transform
+        
+    Returns:
+        om.MDagPath: Path to the mesh shape, or None if there is none
+    """
+    for index in range(dag_path.numberOfShapesDirectlyBelow()):
+        shape_path = om.MDagPath(dag_path)
+        shape_path.extendToShapeDirectlyBelow(index)
+        if (shape_path.hasFn(om.MFn.kMesh) and
+                not om.MFnDagNode(shape_path).isIntermediateObject):
+            return shape_path
+    return None
 
 
 def get_selected_mesh():
@@ -26,17 +173,72 @@ def get_selected_mesh():
     Returns:
         tuple: (success, full_path, message)
     """
-    selection = cmds.ls(selection=True, type='transform', long=True)
+    success, handle, message = get_selected_mesh_handle()
+    return (success, get_handle_path(handle) if success else None, message)
+
+
+def get_selected_mesh_handle():
+    """
+    Get currently selected mesh as a handle that survives renames/reparents
+    
+    Returns:
+        tuple: (success, om.MObjectHandle, message)
+    """
+    with maintained_selection_api(), tool_context("selectSuperContext"):
+        return _get_selected_mesh()
+
+
+def get_handle_path(handle):
+    """
+    Get the current full path of a node handle
+    
+    Args:
+        handle (om.MObjectHandle): Handle to a DAG node
+        
+    Returns:
+        str: Full path, or None if the node no longer exists
+    """
+    if not handle.isValid():
+        return None
+    return om.MFnDagNode(handle.object()).fullPathName()
+
+
+def _get_selected_mesh():
+    """Body of get_selected_mesh_handle, run under the Select tool"""
+def _get_topology_counts(mesh):
+    """
+    Get vertex/face/edge counts for a mesh
+    
+    Deliberately not memoized: MFnMesh reads these counts in O(1), and a
+    cache keyed by mesh name would go stale after a topology edit.
     
-    if not selection:
-        return (False, None, "Please select a mesh")
+    Args:
+        mesh (str): Mesh transform or shape name
+        
+    Returns:
+        dict: Counts keyed by 'vertices', 'faces' and 'edges'
+    """
+    selection = om.MSelectionList()
+    selection.add(mesh)
+    dag_path = selection.getDagPath(0)
     
-    # Check if it has a mesh shape
-    shapes = cmds.listRelatives(selection[0], shapes=True, type='mesh')
-    if not shapes:
-        return (False, None, "Selected object is not a mesh")
+    if not dag_path.hasFn(om.MFn.kMesh):
+        dag_path = _find_mesh_shape(dag_path)
+        if dag_path is None:
+            raise RuntimeError("'{}' is not a mesh".format(mesh))
     
-    return (True, selection[0], "Mesh selected successfully")
+    mesh_fn = om.MFnMesh(dag_path)
+    return {
+        'vertices': mesh_fn.numVertices,
+        'faces': mesh_fn.numPolygons,
+        'edges': mesh_fn.numEdges
+    }
+
+
+def _format_topology(info):
+    """Format one mesh entry of a topology report"""
+    return "  {}: {} verts, {} faces, {} edges".format(
+        info['name'], info['vertices'], info['faces'], info['edges'])
 
 
 def check_topology_match(mesh1, mesh2):
@@ -51,41 +253,26 @@ def check_topology_match(mesh1, mesh2):
         tuple: (is_match, details_dict)
     """
     try:
-        # Get topology info for mesh1
-        vtx1 = cmds.polyEvaluate(mesh1, vertex=True)
-        face1 = cmds.polyEvaluate(mesh1, face=True)
-        edge1 = cmds.polyEvaluate(mesh1, edge=True)
-        
-        # Get topology info for mesh2
-        vtx2 = cmds.polyEvaluate(mesh2, vertex=True)
-        face2 = cmds.polyEvaluate(mesh2, face=True)
-        edge2 = cmds.polyEvaluate(mesh2, edge=True)
+        with maintained_selection_api(), tool_context("selectSuperContext"):
+            counts1 = _get_topology_counts(mesh1)
+            counts2 = _get_topology_counts(mesh2)
         
         details = {
-            'mesh1': {
-                'name': get_short_name(mesh1),
-                'vertices': vtx1,
-                'faces': face1,
-                'edges': edge1
-            },
-            'mesh2': {
-                'name': get_short_name(mesh2),
-                'vertices': vtx2,
-                'faces': face2,
-                'edges': edge2
-            },
-            'match': vtx1 == vtx2 and face1 == face2 and edge1 == edge2
+            'mesh1': dict(counts1, name=get_short_name(mesh1)),
+            'mesh2': dict(counts2, name=get_short_name(mesh2)),
+            'match': counts1 == counts2
         }
         
         # Print info
-        print("=" * 50)
-        print("Topology Check:")
-        print("  {}: {} verts, {} faces, {} edges".format(
-            details['mesh1']['name'], vtx1, face1, edge1))
-        print("  {}: {} verts, {} faces, {} edges".format(
-            details['mesh2']['name'], vtx2, face2, edge2))
-        print("  Result: {}".format("MATCHED" if details['match'] else "NOT MATCHED"))
-        print("=" * 50)
+        if _DEBUG:
+            sys.stdout.write("\n".join([
+                "=" * 50,
+                "Topology Check:",
+                _format_topology(details['mesh1']),
+                _format_topology(details['mesh2']),
+                "  Result: {}".format("MATCHED" if details['match'] else "NOT MATCHED"),
+                "=" * 50
+            ]) + "\n")
         
         return (details['match'], details)
         
@@ -106,21 +293,43 @@ def get_timeline_range():
     return (start, end)
 
 
+def _on_plugin_unloaded(*args):
+    """Forget the loaded state when any plugin is unloaded"""
+    global _PLUGIN_LOADED
+    _PLUGIN_LOADED = False
+
+
 def load_dembones_plugin():
     """
     Load DemBones plugin if not loaded
     
+    The loaded state is remembered until a plugin unload is reported, so
+    repeated calls don't query Maya.
+    
     Returns:
         tuple: (success, message)
     """
+    global _PLUGIN_LOADED, _PLUGIN_CALLBACK_ID
+    
+    if _PLUGIN_LOADED:
+        return (True, "DemBones plugin already loaded")
+    
     try:
         if not cmds.pluginInfo('DemBones', query=True, loaded=True):
             cmds.loadPlugin('DemBones')
-            return (True, "DemBones plugin loaded successfully")
-        return (True, "DemBones plugin already loaded")
+            message = "DemBones plugin loaded successfully"
+        else:
+            message = "DemBones plugin already loaded"
     except Exception as e:
         error_msg = "Failed to load DemBones plugin: {}".format(str(e))
         return (False, error_msg)
+    
+    _PLUGIN_LOADED = True
+    if _PLUGIN_CALLBACK_ID is None:
+        _PLUGIN_CALLBACK_ID = om.MSceneMessage.addStringArrayCallback(
+            om.MSceneMessage.kAfterPluginUnload, _on_plugin_unloaded)
+    return (True, message)
+
 
 def duplicate_static_meshes(*args):
     """
@@ -132,14 +341,13 @@ def duplicate_static_meshes(*args):
         return []
 
     current_frame = cmds.currentTime(q=True)
-    static_meshes = []
-
-    for obj in sel:
-        dup = cmds.duplicate(obj, name=f"{obj.split('|')[-1]}_static")[0]
-        cmds.currentTime(current_frame)
-        cmds.makeIdentity(dup, apply=True, t=1, r=1, s=1, n=0)
-        cmds.delete(dup, ch=True)
-        static_meshes.append(dup)
+
+    # Duplicate, freeze and clean the whole selection in one command each
+    dups = cmds.duplicate(sel, returnRootsOnly=True)
+    static_meshes = [cmds.rename(dup, f"{get_short_name(obj)}_static")
+                     for dup, obj in zip(dups, sel)]
+    cmds.makeIdentity(static_meshes, apply=True, t=1, r=1, s=1, n=0)
+    cmds.delete(static_meshes, ch=True)
 
     cmds.select(static_meshes, r=True)
     print(f"✅ Created {len(static_meshes)} static meshes at frame {int(current_frame)}.")
@@ -8,14 +8,24 @@ from . import utils
 class DemBonesValidator:
     """Validator for Dem Bones inputs"""
     
+    # Error message templates
+    ERR_NOT_SET = "{} is not set"
+    ERR_NOT_EXIST = "{} does not exist"
+    ERR_SAME_MESH = "Source and target meshes cannot be the same"
+    ERR_FRAME_RANGE = "Start frame ({}) must be less than end frame ({})"
+    ERR_GLOBAL_ITERS = "Global iterations must be at least 1"
+    ERR_NUM_BONES = "Number of bones must be at least 1"
+    ERR_TOPOLOGY = "Source and target meshes do not have matching topology"
+    
     @staticmethod
-    def validate_mesh(mesh_path, mesh_type="mesh"):
+    def validate_mesh(mesh_path, mesh_type="mesh", exists=None):
         """
         Validate a single mesh
         
         Args:
             mesh_path (str): Full path to mesh
             mesh_type (str): Type description for error message
+            exists (bool): Known existence of the mesh, queried if None
             
         Returns:
             list: List of error messages (empty if valid)
@@ -23,9 +33,12 @@ class DemBonesValidator:
         errors = []
         
         if not mesh_path:
-            errors.append("{} is not set".format(mesh_type.capitalize()))
-        elif not cmds.objExists(mesh_path):
-            errors.append("{} does not exist".format(mesh_type.capitalize()))
+            errors.append(DemBonesValidator.ERR_NOT_SET.format(mesh_type.capitalize()))
+        else:
+            if exists is None:
+                exists = cmds.objExists(mesh_path)
+            if not exists:
+                errors.append(DemBonesValidator.ERR_NOT_EXIST.format(mesh_type.capitalize()))
         
         return errors
     
@@ -44,8 +57,7 @@ class DemBonesValidator:
         errors = []
         
         if start_frame >= end_frame:
-            errors.append("Start frame ({}) must be less than end frame ({})".format(
-                start_frame, end_frame))
+            errors.append(DemBonesValidator.ERR_FRAME_RANGE.format(start_frame, end_frame))
         
         return errors
     
@@ -64,10 +76,10 @@ class DemBonesValidator:
         errors = []
         
         if global_iters < 1:
-            errors.append("Global iterations must be at least 1")
+            errors.append(DemBonesValidator.ERR_GLOBAL_ITERS)
         
         if num_bones < 1:
-            errors.append("Number of bones must be at least 1")
+            errors.append(DemBonesValidator.ERR_NUM_BONES)
         
         return errors
     
@@ -77,6 +89,9 @@ class DemBonesValidator:
         """
         Validate all inputs
         
+        Cheap checks run first; the topology comparison only runs once
+        every other check has passed.
+        
         Args:
             source_mesh (str): Source mesh path
             target_mesh (str): Target mesh path
@@ -91,15 +106,23 @@ class DemBonesValidator:
         """
         errors = []
         
+        # Resolve existence of both meshes with a single ls query
+        # (an empty ls would list the whole scene). Names not found as
+        # given, e.g. short names, fall back to objExists (exists=None).
+        meshes = [mesh for mesh in (source_mesh, target_mesh) if mesh]
+        existing = set(cmds.ls(meshes, long=True)) if meshes else set()
+        
         # Validate source mesh
-        errors.extend(DemBonesValidator.validate_mesh(source_mesh, "Source mesh"))
+        errors.extend(DemBonesValidator.validate_mesh(
+            source_mesh, "Source mesh", exists=(source_mesh in existing) or None))
         
         # Validate target mesh
-        errors.extend(DemBonesValidator.validate_mesh(target_mesh, "Target mesh"))
+        errors.extend(DemBonesValidator.validate_mesh(
+            target_mesh, "Target mesh", exists=(target_mesh in existing) or None))
         
         # Check if source and target are the same
         if source_mesh and target_mesh and source_mesh == target_mesh:
-            errors.append("Source and target meshes cannot be the same")
+            errors.append(DemBonesValidator.ERR_SAME_MESH)
         
         # Validate frame range
         errors.extend(DemBonesValidator.validate_frame_range(start_frame, end_frame))
@@ -107,11 +130,14 @@ class DemBonesValidator:
         # Validate parameters
         errors.extend(DemBonesValidator.validate_parameters(global_iters, num_bones))
         
+        # Don't spend any work on topology while the inputs are invalid
+        if errors:
+            return (False, errors)
+        
         # Check topology match
-        if check_topology and source_mesh and target_mesh:
-            if cmds.objExists(source_mesh) and cmds.objExists(target_mesh):
-                is_match, details = utils.check_topology_match(source_mesh, target_mesh)
-                if not is_match:
-                    errors.append("Source and target meshes do not have matching topology")
+        if check_topology:
+            is_match, details = utils.check_topology_match(source_mesh, target_mesh)
+            if not is_match:
+                errors.append(DemBonesValidator.ERR_TOPOLOGY)
         
         return (len(errors) == 0, errors)
\ No newline at end of file
@@ -8,10 +8,27 @@ Installs for ALL Maya versions (2020-2025) - auto detection
 import os
 import shutil
 import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
 import maya.cmds as cmds
 import maya.mel as mel
 
 
+COPY_BUFSIZE = 1024 * 1024
+
+
+def _fast_copy(src, dst):
+    """Copy a file's data and metadata, like shutil.copy2 to a file path"""
+    if sys.version_info < (3, 8):
+        # Python 3.7 (Maya 2022): copyfile has no fast path and a 16 KiB buffer
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, COPY_BUFSIZE)
+    else:
+        # sendfile / fcopyfile, or a 1 MiB readinto loop on Windows
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
 class DemBonesInstaller:
     
     TOOL_NAME = "dembones_maya_tool"
@@ -19,6 +36,21 @@ class DemBonesInstaller:
     ICON_NAME = "icon.png"
     SHELF_NAME = "CustomTools"
     PLUGINS_DIR = "outputMll"
+    MAYA_YEARS = range(2018, 2026)
+    TOOL_IGNORE_PATTERNS = ('__pycache__', '*.pyc', '*.pyo', '.git',
+                            '.mypy_cache', '.pytest_cache')
+    
+    # Python source run by the shelf button, built once at class load.
+    # {scripts_dir} is filled in at install time so clicks make no Maya calls.
+    _SHELF_COMMAND = textwrap.dedent('''\
+        import sys
+        
+        if {scripts_dir!r} not in sys.path:
+            sys.path.insert(0, {scripts_dir!r})
+        
+        import dembones_maya_tool
+        dembones_maya_tool.show_ui()
+        ''')
     
     def __init__(self):
         self.installer_dir = os.path.dirname(__file__)
@@ -26,148 +58,235 @@ class DemBonesInstaller:
         self.tool_source = os.path.join(self.installer_dir, self.TOOL_NAME)
         self.icon_source = os.path.join(self.installer_dir, self.ICON_NAME)
         self.maya_docs = os.path.expanduser("~/Documents/maya")
+        self._mll_index = self._scan_plugins()
+        self._dir_cache = set()
+        self._has_icon = False
+        self._plugin_blobs = {}
+        self._log_lines = []
     
     def install(self):
-        print("\n" + "=" * 70)
-        print("  DEM BONES MAYA TOOL - INSTALLER")
-        print("=" * 70)
+        try:
+            return self._install()
+        finally:
+            self._flush_log()
+    
+    def _log(self, message):
+        """Queue a line of output, written out by _flush_log"""
+        self._log_lines.append(message)
+    
+    def _flush_log(self):
+        """Write all queued output in a single call"""
+        if self._log_lines:
+            sys.stdout.write("\n".join(self._log_lines) + "\n")
+            sys.stdout.flush()
+            self._log_lines = []
+    
+    def _install(self):
+        self._log("\n" + "=" * 70)
+        self._log("  DEM BONES MAYA TOOL - INSTALLER")
+        self._log("=" * 70)
         
         if not self._validate_sources():
             return False
         
         versions = self._find_maya_versions()
         if not versions:
-            print("\n[ERROR] No Maya versions found in: " + self.maya_docs)
+            self._log("\n[ERROR] No Maya versions found in: " + self.maya_docs)
             return False
         
-        print("\nFound Maya versions: " + ", ".join(versions))
+        self._log("\nFound Maya versions: " + ", ".join(versions))
+        
+        self._read_plugins(versions)
         
-        for version in versions:
-            self._install_for_version(version)
+        # Versions are independent and I/O bound; queue each one's log in order
+        with ThreadPoolExecutor(max_workers=min(8, len(versions))) as executor:
+            for log in executor.map(self._install_for_version, versions):
+                self._log_lines.extend(log)
         
         self._create_shelf_button()
         self._load_plugin_in_current_session()
         
-        print("\n" + "=" * 70)
-        print("  ✅ INSTALLATION COMPLETED SUCCESSFULLY!")
-        print("=" * 70)
-        print("\nTo use the tool:")
-        print("  • Click the 'DemBones' shelf button")
-        print("  • Or run in Script Editor: import dembones_maya_tool; dembones_maya_tool.show_ui()")
-        print("\n" + "=" * 70 + "\n")
+        self._log("\n" + "=" * 70)
+        self._log("  ✅ INSTALLATION COMPLETED SUCCESSFULLY!")
+        self._log("=" * 70)
+        self._log("\nTo use the tool:")
+        self._log("  • Click the 'DemBones' shelf button")
+        self._log("  • Or run in Script Editor: import dembones_maya_tool; dembones_maya_tool.show_ui()")
+        self._log("\n" + "=" * 70 + "\n")
         
         return True
     
+    def _scan_plugins(self):
+        """Map .mll file names to paths, or None if the plugins folder is missing"""
+        try:
+            with os.scandir(self.plugins_dir) as it:
+                return {e.name: e.path for e in it
+                        if e.is_file() and e.name.endswith('.mll')}
+        except FileNotFoundError:
+            return None
+    
     def _validate_sources(self):
         errors = []
         
-        if not os.path.exists(self.plugins_dir):
+        if self._mll_index is None:
             errors.append("Missing plugins folder: " + self.PLUGINS_DIR)
+        elif not self._mll_index:
+            errors.append("No .mll files found in: " + self.PLUGINS_DIR)
         else:
-            mll_files = [f for f in os.listdir(self.plugins_dir) if f.endswith('.mll')]
-            if not mll_files:
-                errors.append("No .mll files found in: " + self.PLUGINS_DIR)
-            else:
-                print("\nFound plugin files:")
-                for mll in sorted(mll_files):
-                    print("  • " + mll)
+            self._log("\nFound plugin files:")
+            for mll in sorted(self._mll_index):
+                self._log("  • " + mll)
+        
+        # One directory read answers both the tool folder and icon checks
+        with os.scandir(self.installer_dir or os.curdir) as it:
+            entries = {e.name: e for e in it}
         
-        if not os.path.exists(self.tool_source):
+        tool_entry = entries.get(self.TOOL_NAME)
+        if tool_entry is None or not tool_entry.is_dir():
             errors.append("Missing folder: " + self.TOOL_NAME)
         
-        if not os.path.exists(self.icon_source):
-            print("\n[WARNING] Icon file not found: " + self.ICON_NAME)
-            print("  Button will use default icon")
+        self._has_icon = self.ICON_NAME in entries
+        if not self._has_icon:
+            self._log("\n[WARNING] Icon file not found: " + self.ICON_NAME)
+            self._log("  Button will use default icon")
         
         if errors:
-            print("\n[ERROR] Installation failed!")
+            self._log("\n[ERROR] Installation failed!")
             for error in errors:
-                print("  • " + error)
+                self._log("  • " + error)
             return False
         
         return True
     
     def _find_maya_versions(self):
-        if not os.path.exists(self.maya_docs):
-            return []
-        
-        versions = []
-        for name in os.listdir(self.maya_docs):
-            if name.isdigit() and 2018 <= int(name) <= 2025:
-                maya_dir = os.path.join(self.maya_docs, name)
-                if os.path.isdir(maya_dir):
-                    versions.append(name)
+        # Probe the few supported years instead of listing the whole folder
+        versions = [str(year) for year in self.MAYA_YEARS
+                    if os.path.isdir(os.path.join(self.maya_docs, str(year)))]
         
-        return sorted(versions)
+        return versions
     
     def _find_plugin_for_version(self, version):
-        if not os.path.exists(self.plugins_dir):
+        if not self._mll_index:
             return None
         
-        exact_match = "DemBones_maya" + version + ".mll"
-        exact_path = os.path.join(self.plugins_dir, exact_match)
+        plugin_path = (self._mll_index.get("DemBones_maya" + version + ".mll") or
+                       self._mll_index.get("DemBones_" + version + ".mll"))
+        if plugin_path:
+            return plugin_path
         
-        if os.path.exists(exact_path):
-            return exact_path
-        
-        alt_match = "DemBones_" + version + ".mll"
-        alt_path = os.path.join(self.plugins_dir, alt_match)
-        
-        if os.path.exists(alt_path):
-            return alt_path
-        
-        generic_path = os.path.join(self.plugins_dir, "DemBones.mll")
-        if os.path.exists(generic_path):
-            print("  ℹ Using generic DemBones.mll")
-            return generic_path
+        return self._mll_index.get("DemBones.mll")
+    
+    def _read_plugins(self, versions):
+        """Read each needed plugin binary once, even if versions share it"""
+        sources = {self._find_plugin_for_version(version) for version in versions}
+        sources.discard(None)
+        for source in sources:
+            try:
+                with open(source, 'rb') as f:
+                    self._plugin_blobs[source] = f.read()
+            except OSError:
+                # _copy_plugin falls back to a file copy and reports the error
+                pass
+    
+    def _copy_plugin(self, source, dest):
+        """Write a plugin from its in-memory bytes, keeping source metadata"""
+        blob = self._plugin_blobs.get(source)
+        if blob is None:
+            _fast_copy(source, dest)
+            return
         
-        return None
+        with open(dest, 'wb') as f:
+            f.write(blob)
+        shutil.copystat(source, dest)
     
     def _install_for_version(self, version):
-        print("\n--- Installing for Maya " + version + " ---")
+        """Install into one Maya version and return its log lines"""
+        log = ["\n--- Installing for Maya " + version + " ---"]
         
+        # Build every per-version path once, from the shortest shared prefix
         version_dir = os.path.join(self.maya_docs, version)
         plug_dir = os.path.join(version_dir, "plug-ins")
         scripts_dir = os.path.join(version_dir, "scripts")
         icons_dir = os.path.join(version_dir, "prefs", "icons")
+        plugin_dest = os.path.join(plug_dir, self.PLUGIN_NAME)
+        tool_dest = os.path.join(scripts_dir, self.TOOL_NAME)
+        icon_dest = os.path.join(icons_dir, self.ICON_NAME)
         
-        os.makedirs(plug_dir, exist_ok=True)
-        os.makedirs(scripts_dir, exist_ok=True)
-        os.makedirs(icons_dir, exist_ok=True)
+        self._ensure_dir(plug_dir)
+        self._ensure_dir(scripts_dir)
+        self._ensure_dir(icons_dir)
         
         plugin_source = self._find_plugin_for_version(version)
         
         if plugin_source:
-            plugin_dest = os.path.join(plug_dir, self.PLUGIN_NAME)
+            if os.path.basename(plugin_source) == "DemBones.mll":
+                log.append("  ℹ Using generic DemBones.mll")
             try:
-                shutil.copy2(plugin_source, plugin_dest)
-                print("  ✓ Plugin copied: " + os.path.basename(plugin_source))
-                print("    → " + plugin_dest)
+                self._copy_plugin(plugin_source, plugin_dest)
+                log.append("  ✓ Plugin copied: " + os.path.basename(plugin_source))
+                log.append("    → " + plugin_dest)
             except Exception as e:
-                print("  ✗ Failed to copy plugin: " + str(e))
+                log.append("  ✗ Failed to copy plugin: " + str(e))
         else:
-            print("  ⚠ No plugin found for Maya " + version)
+            log.append("  ⚠ No plugin found for Maya " + version)
         
-        tool_dest = os.path.join(scripts_dir, self.TOOL_NAME)
         try:
-            if os.path.exists(tool_dest):
-                shutil.rmtree(tool_dest)
-            
-            shutil.copytree(self.tool_source, tool_dest)
-            print("  ✓ Tool copied to: " + scripts_dir)
+            self._deploy_tool(tool_dest)
+            log.append("  ✓ Tool copied to: " + scripts_dir)
         except Exception as e:
-            print("  ✗ Failed to copy tool: " + str(e))
+            log.append("  ✗ Failed to copy tool: " + str(e))
         
-        if os.path.exists(self.icon_source):
-            icon_dest = os.path.join(icons_dir, self.ICON_NAME)
+        if self._has_icon:
             try:
-                shutil.copy2(self.icon_source, icon_dest)
-                print("  ✓ Icon copied to: " + icons_dir)
+                _fast_copy(self.icon_source, icon_dest)
+                log.append("  ✓ Icon copied to: " + icons_dir)
             except Exception as e:
-                print("  ✗ Failed to copy icon: " + str(e))
+                log.append("  ✗ Failed to copy icon: " + str(e))
+        
+        return log
+    
+    def _ensure_dir(self, path):
+        """os.makedirs, skipped for directories already made or seen"""
+        if path in self._dir_cache:
+            return
+        os.makedirs(path, exist_ok=True)
+        
+        # The directory and all of its ancestors now exist
+        while path not in self._dir_cache:
+            self._dir_cache.add(path)
+            parent = os.path.dirname(path)
+            if parent == path:
+                break
+            path = parent
+    
+    def _deploy_tool(self, tool_dest):
+        """Copy the tool into place, swapping out any old copy by rename"""
+        new_dest = tool_dest + ".new"
+        old_dest = tool_dest + ".old"
+        
+        # Leftovers from an interrupted install
+        for leftover in (new_dest, old_dest):
+            try:
+                shutil.rmtree(leftover)
+            except FileNotFoundError:
+                pass
+        
+        shutil.copytree(self.tool_source, new_dest, copy_function=_fast_copy,
+                        ignore=shutil.ignore_patterns(*self.TOOL_IGNORE_PATTERNS))
+        
+        try:
+            os.replace(tool_dest, old_dest)
+            replaced = True
+        except FileNotFoundError:
+            replaced = False
+        os.replace(new_dest, tool_dest)
+        
+        # Deleted before returning so a quick re-install never finds it half gone
+        if replaced:
+            shutil.rmtree(old_dest, ignore_errors=True)
     
     def _create_shelf_button(self):
-        print("\n--- Creating Shelf Button ---")
+        self._log("\n--- Creating Shelf Button ---")
         
         try:
             top_level_shelf = mel.eval('$tempVar = $gShelfTopLevel')
@@ -177,26 +296,16 @@ class DemBonesInstaller:
             
             shelf = cmds.shelfLayout(self.SHELF_NAME, parent=top_level_shelf)
             
-            command = '''import sys
-import importlib
-
-scripts_dir = cmds.internalVar(userScriptDir=True)
-tool_path = os.path.join(scripts_dir, 'dembones_maya_tool')
-if tool_path not in sys.path:
-    sys.path.insert(0, scripts_dir)
-
-import dembones_maya_tool
-importlib.reload(dembones_maya_tool)
-dembones_maya_tool.show_ui()
-'''
+            scripts_dir = cmds.internalVar(userScriptDir=True)
+            command = self._SHELF_COMMAND.format(scripts_dir=scripts_dir)
             
             icon_path = "commandButton.png"
             prefs_icons = os.path.join(cmds.internalVar(userPrefDir=True), "icons", self.ICON_NAME)
             if os.path.exists(prefs_icons):
                 icon_path = prefs_icons
-                print("  ✓ Using custom icon: " + self.ICON_NAME)
+                self._log("  ✓ Using custom icon: " + self.ICON_NAME)
             else:
-                print("  ℹ Using default icon")
+                self._log("  ℹ Using default icon")
             
             cmds.shelfButton(
                 parent=shelf,
@@ -208,19 +317,19 @@ dembones_maya_tool.show_ui()
                 sourceType="python"
             )
             
-            print("  ✓ Shelf '" + self.SHELF_NAME + "' created with button")
+            self._log("  ✓ Shelf '" + self.SHELF_NAME + "' created with button")
             
             try:
                 mel.eval('saveAllShelves $gShelfTopLevel')
-                print("  ✓ Shelf saved")
+                self._log("  ✓ Shelf saved")
             except:
                 pass
             
         except Exception as e:
-            print("  ✗ Failed to create shelf button: " + str(e))
+            self._log("  ✗ Failed to create shelf button: " + str(e))
     
     def _load_plugin_in_current_session(self):
-        print("\n--- Loading Plugin in Current Session ---")
+        self._log("\n--- Loading Plugin in Current Session ---")
         
         try:
             maya_version = cmds.about(version=True)
@@ -228,31 +337,38 @@ dembones_maya_tool.show_ui()
             current_plugin = os.path.join(current_plug_dir, self.PLUGIN_NAME)
             
             if not os.path.exists(current_plugin):
-                print("  ⚠ Plugin not installed for Maya " + maya_version)
+                self._log("  ⚠ Plugin not installed for Maya " + maya_version)
                 return
             
             try:
-                if cmds.pluginInfo(self.PLUGIN_NAME, query=True, loaded=True):
-                    print("  ℹ Plugin already loaded, reloading...")
-                    cmds.unloadPlugin(self.PLUGIN_NAME)
+                # Query each plugin attribute once and reuse the answers below
+                info = {'loaded': cmds.pluginInfo(self.PLUGIN_NAME, query=True, loaded=True)}
                 
-                cmds.loadPlugin(current_plugin)
-                print("  ✓ Plugin loaded: " + self.PLUGIN_NAME)
-                
-                cmds.pluginInfo(self.PLUGIN_NAME, edit=True, autoload=True)
-                print("  ✓ Auto-load enabled")
-                
-                commands = cmds.pluginInfo(self.PLUGIN_NAME, query=True, command=True)
-                if commands:
-                    print("  ✓ Available commands: " + str(commands))
+                if info['loaded']:
+                    self._log("  ℹ Plugin already loaded")
                 else:
-                    print("  ⚠ No commands found in plugin")
+                    info['loaded'] = bool(cmds.loadPlugin(current_plugin, quiet=True))
+                    self._log("  ✓ Plugin loaded: " + self.PLUGIN_NAME)
+                
+                if info['loaded']:
+                    info['autoload'] = cmds.pluginInfo(self.PLUGIN_NAME, query=True, autoload=True)
+                    info['commands'] = cmds.pluginInfo(self.PLUGIN_NAME, query=True, command=True)
+                    
+                    # Editing autoload rewrites the plugin prefs, so only do it when needed
+                    if not info['autoload']:
+                        cmds.pluginInfo(self.PLUGIN_NAME, edit=True, autoload=True)
+                    self._log("  ✓ Auto-load enabled")
+                    
+                    if info['commands']:
+                        self._log("  ✓ Available commands: " + str(info['commands']))
+                    else:
+                        self._log("  ⚠ No commands found in plugin")
                     
             except Exception as e:
-                print("  ✗ Failed to load plugin: " + str(e))
+                self._log("  ✗ Failed to load plugin: " + str(e))
                 
         except Exception as e:
-            print("  ✗ Error: " + str(e))
+            self._log("  ✗ Error: " + str(e))
 
 
 def install():
@@ -6,120 +6,212 @@ Removes tool from ALL Maya versions (2020–2025)
 """
 
 import os
-import shutil
+import stat
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import maya.cmds as cmds # type: ignore
 import maya.mel as mel # type: ignore
 
 
+# Windows-only stat flags; zero elsewhere so the checks below fall through
+_REPARSE_POINT = getattr(stat, "FILE_ATTRIBUTE_REPARSE_POINT", 0)
+_ATTR_DIRECTORY = getattr(stat, "FILE_ATTRIBUTE_DIRECTORY", 0)
+
+
+def _is_link(st):
+    """True for a symlink or a Windows junction, given its lstat result"""
+    return stat.S_ISLNK(st.st_mode) or bool(getattr(st, "st_file_attributes", 0) & _REPARSE_POINT)
+
+
+def _remove_link(path, st):
+    """Remove a link itself, never its target; Windows directory links need rmdir"""
+    if getattr(st, "st_file_attributes", 0) & _ATTR_DIRECTORY:
+        os.rmdir(path)
+    else:
+        os.unlink(path)
+
+
+def _fast_rmtree(path):
+    """Delete a directory tree: one scandir walk, parallel unlinks, then rmdir bottom-up.
+    Symlinks and junctions are removed as links and never followed."""
+    root_stat = os.lstat(path)
+    if _is_link(root_stat):
+        _remove_link(path, root_stat)
+        return
+    
+    files = []
+    links = []
+    dirs = []
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_symlink():
+                    links.append((entry.path, entry.stat(follow_symlinks=False)))
+                elif entry.is_dir(follow_symlinks=False):
+                    # Junctions look like plain directories to is_dir on older Pythons
+                    entry_stat = entry.stat(follow_symlinks=False)
+                    if _is_link(entry_stat):
+                        links.append((entry.path, entry_stat))
+                    else:
+                        stack.append(entry.path)
+                else:
+                    files.append(entry.path)
+    
+    for link_path, link_stat in links:
+        _remove_link(link_path, link_stat)
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(os.unlink, files))
+    
+    # Every directory was listed after its parent, so reverse order is children first
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+
+
 class DemBonesUninstaller:
     
     TOOL_NAME = "dembones_maya_tool"
     PLUGIN_NAME = "DemBones.mll"
     SHELF_NAME = "DemBones"
+    MAYA_YEARS = range(2018, 2026)
+    ICON_NAMES = ("dembones.png", "dembones_icon.png")
     
     def __init__(self):
         self.maya_docs = os.path.expanduser("~/Documents/maya")
+        self._log_lines = []
     
     def uninstall(self):
         """Run complete uninstallation"""
-        print("\n" + "=" * 70)
-        print("  DEM BONES MAYA TOOL - UNINSTALLER")
-        print("=" * 70)
+        try:
+            return self._uninstall()
+        finally:
+            self._flush_log()
+    
+    # ---------------------------------------------------------
+    def _log(self, message):
+        """Queue a line of output, written out by _flush_log"""
+        self._log_lines.append(message)
+    
+    # ---------------------------------------------------------
+    def _flush_log(self):
+        """Write all queued output in a single call"""
+        if self._log_lines:
+            sys.stdout.write("\n".join(self._log_lines) + "\n")
+            sys.stdout.flush()
+            self._log_lines = []
+    
+    # ---------------------------------------------------------
+    def _uninstall(self):
+        self._log("\n" + "=" * 70)
+        self._log("  DEM BONES MAYA TOOL - UNINSTALLER")
+        self._log("=" * 70)
         
         versions = self._find_maya_versions()
         if not versions:
-            print("\n[WARNING] No Maya versions found in: " + self.maya_docs)
+            self._log("\n[WARNING] No Maya versions found in: " + self.maya_docs)
         else:
-            print("\nFound Maya versions: " + ", ".join(versions))
-            for version in versions:
-                self._uninstall_for_version(version)
+            self._log("\nFound Maya versions: " + ", ".join(versions))
+            # Versions are independent and I/O bound; queue each one's log in order
+            with ThreadPoolExecutor(max_workers=min(8, len(versions))) as executor:
+                for log in executor.map(self._uninstall_for_version, versions):
+                    self._log_lines.extend(log)
         
         self._remove_shelf()
         self._unload_plugin()
         self._refresh_ui()
 
-        print("\n" + "=" * 70)
-        print("  ✅ UNINSTALLATION COMPLETED SUCCESSFULLY!")
-        print("=" * 70 + "\n")
+        self._log("\n" + "=" * 70)
+        self._log("  ✅ UNINSTALLATION COMPLETED SUCCESSFULLY!")
+        self._log("=" * 70 + "\n")
         
         return True
     
     # ---------------------------------------------------------
     def _find_maya_versions(self):
-        if not os.path.exists(self.maya_docs):
-            return []
-        
-        versions = []
-        for name in os.listdir(self.maya_docs):
-            if name.isdigit() and 2018 <= int(name) <= 2025:
-                path = os.path.join(self.maya_docs, name)
-                if os.path.isdir(path):
-                    versions.append(name)
-        return sorted(versions)
+        # Probe the few supported years instead of listing the whole folder
+        versions = [str(year) for year in self.MAYA_YEARS
+                    if os.path.isdir(os.path.join(self.maya_docs, str(year)))]
+        return versions
     
     # ---------------------------------------------------------
     def _uninstall_for_version(self, version):
-        print("\n--- Uninstalling from Maya " + version + " ---")
+        """Uninstall from one Maya version and return its log lines"""
+        log = ["\n--- Uninstalling from Maya " + version + " ---"]
         
+        # Build every per-version path once, from the shortest shared prefix
         version_dir = os.path.join(self.maya_docs, version)
-        plug_dir = os.path.join(version_dir, "plug-ins")
-        scripts_dir = os.path.join(version_dir, "scripts")
-        shelf_dir = os.path.join(version_dir, "prefs", "shelves")
-        icons_dir = os.path.join(version_dir, "prefs", "icons")
+        prefs_dir = os.path.join(version_dir, "prefs")
+        icons_dir = os.path.join(prefs_dir, "icons")
+        plugin_path = os.path.join(version_dir, "plug-ins", self.PLUGIN_NAME)
+        tool_path = os.path.join(version_dir, "scripts", self.TOOL_NAME)
+        shelf_file = os.path.join(prefs_dir, "shelves", "shelf_" + self.SHELF_NAME + ".mel")
         
         removed_items = []
         
         # Remove plugin
-        plugin_path = os.path.join(plug_dir, self.PLUGIN_NAME)
-        if os.path.exists(plugin_path):
-            try:
-                os.remove(plugin_path)
-                removed_items.append("Plugin")
-            except PermissionError:
-                print("  ✗ Permission denied removing plugin. Try running Maya as Administrator.")
-            except Exception as e:
-                print("  ✗ Failed to remove plugin: " + str(e))
+        try:
+            os.remove(plugin_path)
+            removed_items.append("Plugin")
+        except FileNotFoundError:
+            pass
+        except PermissionError:
+            log.append("  ✗ Permission denied removing plugin. Try running Maya as Administrator.")
+        except Exception as e:
+            log.append("  ✗ Failed to remove plugin: " + str(e))
         
         # Remove tool folder
-        tool_path = os.path.join(scripts_dir, self.TOOL_NAME)
-        if os.path.exists(tool_path):
+        try:
+            _fast_rmtree(tool_path)
+            removed_items.append("Tool folder")
+        except FileNotFoundError:
+            pass
+        except PermissionError:
+            log.append("  ✗ Permission denied removing tool folder. Try running Maya as Administrator.")
+        except Exception as e:
+            log.append("  ✗ Failed to remove tool folder: " + str(e))
+        
+        # Remove swap folders left by an interrupted install
+        for leftover in (tool_path + ".new", tool_path + ".old"):
             try:
-                shutil.rmtree(tool_path)
-                removed_items.append("Tool folder")
-            except PermissionError:
-                print("  ✗ Permission denied removing tool folder. Try running Maya as Administrator.")
+                _fast_rmtree(leftover)
+                removed_items.append("Leftover (" + os.path.basename(leftover) + ")")
+            except FileNotFoundError:
+                pass
             except Exception as e:
-                print("  ✗ Failed to remove tool folder: " + str(e))
+                log.append("  ✗ Failed to remove " + leftover + ": " + str(e))
         
         # Remove shelf file
-        shelf_file = os.path.join(shelf_dir, "shelf_" + self.SHELF_NAME + ".mel")
-        if os.path.exists(shelf_file):
-            try:
-                os.remove(shelf_file)
-                removed_items.append("Shelf file")
-            except PermissionError:
-                print("  ✗ Permission denied removing shelf file. Try running Maya as Administrator.")
-            except Exception as e:
-                print("  ✗ Failed to remove shelf file: " + str(e))
+        try:
+            os.remove(shelf_file)
+            removed_items.append("Shelf file")
+        except FileNotFoundError:
+            pass
+        except PermissionError:
+            log.append("  ✗ Permission denied removing shelf file. Try running Maya as Administrator.")
+        except Exception as e:
+            log.append("  ✗ Failed to remove shelf file: " + str(e))
         
         # Remove custom icons
-        if os.path.exists(icons_dir):
-            for file in os.listdir(icons_dir):
-                if "dembones" in file.lower():
-                    try:
-                        os.remove(os.path.join(icons_dir, file))
-                        removed_items.append("Icon (" + file + ")")
-                    except Exception:
-                        pass
+        for icon_name in self.ICON_NAMES:
+            try:
+                os.unlink(os.path.join(icons_dir, icon_name))
+                removed_items.append("Icon (" + icon_name + ")")
+            except Exception:
+                pass
         
         if removed_items:
-            print("  ✓ Removed: " + ", ".join(removed_items))
+            log.append("  ✓ Removed: " + ", ".join(removed_items))
         else:
-            print("  ℹ Nothing to remove (already clean)")
+            log.append("  ℹ Nothing to remove (already clean)")
+        
+        return log
     
     # ---------------------------------------------------------
     def _remove_shelf(self):
-        print("\n--- Removing Shelf from Current Session ---")
+        self._log("\n--- Removing Shelf from Current Session ---")
         
         try:
             if cmds.shelfLayout(self.SHELF_NAME, exists=True):
@@ -131,41 +223,40 @@ class DemBonesUninstaller:
                     except:
                         pass
                 cmds.deleteUI(self.SHELF_NAME, layout=True)
-                print(f"  ✓ Shelf '{self.SHELF_NAME}' removed")
+                self._log(f"  ✓ Shelf '{self.SHELF_NAME}' removed")
                 
                 try:
                     mel.eval('saveAllShelves $gShelfTopLevel')
                 except:
                     pass
             else:
-                print("  ℹ Shelf not found in current session")
+                self._log("  ℹ Shelf not found in current session")
         except Exception as e:
-            print("  ✗ Failed to remove shelf: " + str(e))
+            self._log("  ✗ Failed to remove shelf: " + str(e))
     
     # ---------------------------------------------------------
     def _unload_plugin(self):
-        print("\n--- Unloading Plugin from Current Session ---")
+        self._log("\n--- Unloading Plugin from Current Session ---")
         try:
             plugin_short = self.PLUGIN_NAME.replace(".mll", "")
             if cmds.pluginInfo(plugin_short, q=True, loaded=True):
                 cmds.unloadPlugin(plugin_short)
-                print(f"  ✓ Plugin '{plugin_short}' unloaded")
+                self._log(f"  ✓ Plugin '{plugin_short}' unloaded")
             else:
-                print("  ℹ Plugin not loaded in current session")
+                self._log("  ℹ Plugin not loaded in current session")
         except Exception:
-            print("  ℹ Plugin not found or already unloaded")
+            self._log("  ℹ Plugin not found or already unloaded")
     
     # ---------------------------------------------------------
     def _refresh_ui(self):
-        """Force Maya UI refresh"""
-        print("\n--- Refreshing Maya UI ---")
+        """Refresh the shelf area (no viewport redraw or scene evaluation)"""
+        self._log("\n--- Refreshing Maya UI ---")
         try:
-            cmds.refresh(force=True)
-            mel.eval("buildNewShelfTab $gShelfTopLevel;")  # rebuild shelf area
-            mel.eval("restorePanelState all;")
-            print("  ✓ UI refreshed successfully")
+            mel.eval("saveAllShelves $gShelfTopLevel;")
+            mel.eval("shelfTabChange;")  # redraw only the shelf widget
+            self._log("  ✓ UI refreshed successfully")
         except Exception as e:
-            print("  ℹ UI refresh skipped: " + str(e))
+            self._log("  ℹ UI refresh skipped: " + str(e))
 
 
 # =============================================================